@@ -6,7 +6,7 @@ This example demonstrates how to use PolarisDB with LangChain for
 Retrieval-Augmented Generation (RAG).
 
 Requirements:
-    pip install langchain-openai langchain-core polarisdb
+    pip install langchain-openai langchain-core "polarisdb[arrow]"
 
 Usage:
     export OPENAI_API_KEY="your-api-key"
@@ -33,7 +33,8 @@ from polarisdb.langchain import PolarisDBVectorStore
 
 def format_docs(docs: List) -> str:
     """Format documents for the prompt."""
-    return "\n\n".join(doc.page_content for doc in docs)
+    # A list lets str.join size the result in one pass (no generator)
+    return "\n\n".join([doc.page_content for doc in docs])
 
 
 def main():
@@ -54,15 +55,22 @@ def main():
     # Initialize embedding model
     embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
 
-    # Create vector store with documents
-    vectorstore = PolarisDBVectorStore.from_texts(
-        texts=documents,
-        embedding=embeddings,
-        collection_path="./rag_demo_collection",
+    # Open the vector store; documents persist across runs, so seed it only
+    # the first time instead of adding the same documents again
+    collection_path = "./rag_demo_collection"
+    is_new = not os.path.exists(collection_path)
+    vectorstore = PolarisDBVectorStore(
+        embeddings,
+        collection_path=collection_path,
         metric="cosine",
+        embedding_cache_path="./rag_demo_embeddings.sqlite",  # Reused across runs
     )
-
-    print(f"[OK] Indexed {len(documents)} documents\n")
+    if is_new:
+        vectorstore.add_texts(documents)
+        vectorstore.flush()
+        print(f"[OK] Indexed {len(documents)} documents\n")
+    else:
+        print(f"[OK] Reopened {collection_path}\n")
 
     # Create retriever
     retriever = vectorstore.as_retriever(search_kwargs={"k": 3})
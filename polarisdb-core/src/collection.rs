@@ -5,7 +5,7 @@
 //! - Append-only data file for vectors
 //! - Automatic recovery on open
 
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::fs;
 use std::path::{Path, PathBuf};
 
@@ -215,6 +215,8 @@ impl Collection {
 
     /// Inserts a vector with the given ID.
     pub fn insert(&self, id: VectorId, vector: Vec<f32>, payload: Payload) -> Result<()> {
+        self.check_dimension(&vector)?;
+
         // Write to WAL first
         {
             let mut wal = self.wal.write();
@@ -225,6 +227,44 @@ impl Collection {
         self.apply_insert_no_wal(id, vector, payload)
     }
 
+    /// Inserts multiple vectors with the given IDs.
+    ///
+    /// All WAL entries are appended under a single lock, and the index,
+    /// data file and offset map are each locked once for the whole batch
+    /// instead of once per vector.
+    ///
+    /// The whole batch is validated before anything is logged, so a bad row
+    /// can never reach the WAL and break recovery on the next open.
+    ///
+    /// # Errors
+    ///
+    /// Returns `DimensionMismatch` if any vector has the wrong dimension and
+    /// `DuplicateId` if an id appears more than once in the batch.
+    pub fn insert_batch<I>(&self, entries: I) -> Result<()>
+    where
+        I: IntoIterator<Item = (VectorId, Vec<f32>, Payload)>,
+    {
+        let entries: Vec<_> = entries.into_iter().collect();
+
+        let mut seen = HashSet::with_capacity(entries.len());
+        for (id, vector, _) in &entries {
+            self.check_dimension(vector)?;
+            if !seen.insert(*id) {
+                return Err(Error::DuplicateId(*id));
+            }
+        }
+
+        // Write to WAL first
+        {
+            let mut wal = self.wal.write();
+            for (id, vector, payload) in &entries {
+                wal.append(&WalEntry::insert(*id, vector.clone(), payload.clone()))?;
+            }
+        }
+
+        self.apply_insert_batch_no_wal(entries)
+    }
+
     /// Inserts with auto-generated ID. Returns the ID.
     pub fn insert_auto(&self, vector: Vec<f32>, payload: Payload) -> Result<VectorId> {
         let id = {
@@ -240,6 +280,8 @@ impl Collection {
 
     /// Updates an existing vector.
     pub fn update(&self, id: VectorId, vector: Vec<f32>, payload: Payload) -> Result<()> {
+        self.check_dimension(&vector)?;
+
         // Write to WAL first
         {
             let mut wal = self.wal.write();
@@ -309,6 +351,17 @@ impl Collection {
         &self.path
     }
 
+    // Internal: reject a vector the index would refuse, before it is logged
+    fn check_dimension(&self, vector: &[f32]) -> Result<()> {
+        if vector.len() != self.config.dimension {
+            return Err(Error::DimensionMismatch {
+                expected: self.config.dimension,
+                got: vector.len(),
+            });
+        }
+        Ok(())
+    }
+
     // Internal: apply insert without writing to WAL
     fn apply_insert_no_wal(&self, id: VectorId, vector: Vec<f32>, payload: Payload) -> Result<()> {
         // Write to data file
@@ -340,6 +393,44 @@ impl Collection {
         Ok(())
     }
 
+    // Internal: apply a batch of inserts without writing to WAL
+    fn apply_insert_batch_no_wal(&self, entries: Vec<(VectorId, Vec<f32>, Payload)>) -> Result<()> {
+        // Write to data file
+        let offsets: Vec<u64> = {
+            let mut df = self.data_file.write();
+            entries
+                .iter()
+                .map(|(id, vector, payload)| df.append(*id, vector, payload))
+                .collect::<Result<_>>()?
+        };
+
+        let ids: Vec<VectorId> = entries.iter().map(|(id, _, _)| *id).collect();
+
+        // Update index
+        {
+            let mut index = self.index.write();
+            for (id, vector, payload) in entries {
+                // Remove if exists (for recovery idempotence)
+                index.delete(id);
+                index.insert(id, vector, payload)?;
+            }
+        }
+
+        // Track offsets
+        {
+            let mut tracked = self.offsets.write();
+            tracked.extend(ids.iter().copied().zip(offsets));
+        }
+
+        // Update next_id
+        if let Some(&max_id) = ids.iter().max() {
+            let mut next_id = self.next_id.write();
+            *next_id = (*next_id).max(max_id + 1);
+        }
+
+        Ok(())
+    }
+
     // Internal: apply update without writing to WAL
     fn apply_update_no_wal(&self, id: VectorId, vector: Vec<f32>, payload: Payload) -> Result<()> {
         // Mark old record as deleted
@@ -620,6 +711,77 @@ mod tests {
         let _ = fs::remove_dir_all(&path);
     }
 
+    #[test]
+    fn test_collection_insert_batch() {
+        let path = temp_collection_path();
+        let config = CollectionConfig::new(3, DistanceMetric::Euclidean);
+
+        {
+            let col = Collection::open_or_create(&path, config.clone()).unwrap();
+            col.insert_batch(vec![
+                (1, vec![1.0, 0.0, 0.0], Payload::new()),
+                (2, vec![0.0, 1.0, 0.0], Payload::new()),
+                (3, vec![0.0, 0.0, 1.0], Payload::new()),
+            ])
+            .unwrap();
+            assert_eq!(col.len(), 3);
+            assert_eq!(
+                col.insert_auto(vec![1.0, 1.0, 1.0], Payload::new())
+                    .unwrap(),
+                4
+            );
+        }
+
+        // Reopen without flush - batch must be recoverable from the WAL
+        {
+            let col = Collection::open_or_create(&path, config).unwrap();
+            assert_eq!(col.len(), 4);
+            assert_eq!(col.get(2).unwrap().0, vec![0.0, 1.0, 0.0]);
+        }
+
+        let _ = fs::remove_dir_all(&path);
+    }
+
+    #[test]
+    fn test_collection_insert_batch_rejects_bad_rows_before_logging() {
+        let path = temp_collection_path();
+        let config = CollectionConfig::new(3, DistanceMetric::Euclidean);
+
+        {
+            let col = Collection::open_or_create(&path, config.clone()).unwrap();
+            col.insert(1, vec![1.0, 0.0, 0.0], Payload::new()).unwrap();
+
+            let result = col.insert_batch(vec![
+                (2, vec![0.0, 1.0, 0.0], Payload::new()),
+                (3, vec![0.0, 1.0], Payload::new()),
+            ]);
+            assert!(matches!(
+                result,
+                Err(Error::DimensionMismatch {
+                    expected: 3,
+                    got: 2
+                })
+            ));
+
+            let result = col.insert_batch(vec![
+                (4, vec![0.0, 0.0, 1.0], Payload::new()),
+                (4, vec![1.0, 1.0, 1.0], Payload::new()),
+            ]);
+            assert!(matches!(result, Err(Error::DuplicateId(4))));
+            assert!(col.insert(5, vec![1.0], Payload::new()).is_err());
+            assert_eq!(col.len(), 1);
+        }
+
+        // Nothing from the rejected batches was logged, so recovery succeeds
+        {
+            let col = Collection::open_or_create(&path, config).unwrap();
+            assert_eq!(col.len(), 1);
+            assert!(col.get(2).is_none());
+        }
+
+        let _ = fs::remove_dir_all(&path);
+    }
+
     #[test]
     fn test_collection_delete() {
         let path = temp_collection_path();
@@ -3,8 +3,17 @@
 //! This module provides efficient implementations of common distance metrics
 //! used in vector similarity search. Each metric is optimized with SIMD
 //! instructions when available.
+//!
+//! With the `simd` feature enabled, dot products and squared Euclidean
+//! distances are computed by SimSIMD's runtime-dispatched kernels; the
+//! unrolled scalar loops below remain as the portable fallback.
 
 use serde::{Deserialize, Serialize};
+#[cfg(feature = "simd")]
+use simsimd::SpatialSimilarity;
+
+/// A distance kernel over two equal-length vectors. Lower is more similar.
+pub type DistanceFn = fn(&[f32], &[f32]) -> f32;
 
 /// Supported distance metrics for vector similarity.
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, Serialize, Deserialize, Default)]
@@ -54,6 +63,21 @@ impl DistanceMetric {
         }
     }
 
+    /// Returns the distance kernel for this metric.
+    ///
+    /// Indexes resolve the kernel once at construction and call through it
+    /// in their scan loops, so the metric is not re-matched for every pair
+    /// of vectors as in [`compute`](Self::compute).
+    #[inline]
+    pub fn distance_fn(&self) -> DistanceFn {
+        match self {
+            DistanceMetric::Euclidean => euclidean_distance,
+            DistanceMetric::Cosine => cosine_distance,
+            DistanceMetric::DotProduct => negated_dot_product,
+            DistanceMetric::Hamming => hamming_distance,
+        }
+    }
+
     /// Returns true if lower distance values indicate more similarity.
     ///
     /// All metrics are normalized so that lower values = more similar.
@@ -74,6 +98,13 @@ pub fn euclidean_distance(a: &[f32], b: &[f32]) -> f32 {
 /// Computes squared Euclidean distance (avoids sqrt for comparisons).
 #[inline]
 pub fn euclidean_distance_squared(a: &[f32], b: &[f32]) -> f32 {
+    #[cfg(feature = "simd")]
+    {
+        if let Some(d) = f32::sqeuclidean(a, b) {
+            return d as f32;
+        }
+    }
+
     let mut sum = 0.0;
     let mut chunks_a = a.chunks_exact(16);
     let mut chunks_b = b.chunks_exact(16);
@@ -125,8 +156,24 @@ pub fn euclidean_distance_squared(a: &[f32], b: &[f32]) -> f32 {
 ///
 /// Formula: 1 - (a · b) / (||a|| * ||b||)
 /// Range: [0, 2] where 0 = identical direction, 2 = opposite direction
+///
+/// With the `simd` feature enabled this is SimSIMD's fused cosine kernel,
+/// which reads both vectors once. A zero vector has no direction, so every
+/// path treats it as maximally dissimilar (distance 1.0).
 #[inline]
 pub fn cosine_distance(a: &[f32], b: &[f32]) -> f32 {
+    #[cfg(feature = "simd")]
+    {
+        // SimSIMD has its own zero-norm convention, so catch zero vectors
+        // first; the scan stops at the first non-zero component.
+        if is_zero(a) || is_zero(b) {
+            return 1.0;
+        }
+        if let Some(d) = f32::cosine(a, b) {
+            return d as f32;
+        }
+    }
+
     let dot = dot_product(a, b);
     let norm_a = dot_product(a, a).sqrt();
     let norm_b = dot_product(b, b).sqrt();
@@ -139,11 +186,24 @@ pub fn cosine_distance(a: &[f32], b: &[f32]) -> f32 {
     1.0 - (dot / denominator)
 }
 
+#[cfg(feature = "simd")]
+#[inline]
+fn is_zero(v: &[f32]) -> bool {
+    v.iter().all(|&x| x == 0.0)
+}
+
 /// Computes dot product (inner product) between two vectors.
 ///
 /// Formula: sum(a\[i\] * b\[i\])
 #[inline]
 pub fn dot_product(a: &[f32], b: &[f32]) -> f32 {
+    #[cfg(feature = "simd")]
+    {
+        if let Some(d) = f32::dot(a, b) {
+            return d as f32;
+        }
+    }
+
     let mut sum = 0.0;
     let mut chunks_a = a.chunks_exact(16);
     let mut chunks_b = b.chunks_exact(16);
@@ -173,6 +233,12 @@ pub fn dot_product(a: &[f32], b: &[f32]) -> f32 {
     sum
 }
 
+/// Negated dot product, so that lower = more similar.
+#[inline]
+fn negated_dot_product(a: &[f32], b: &[f32]) -> f32 {
+    -dot_product(a, b)
+}
+
 /// Computes Hamming distance for binary-like vectors.
 ///
 /// Treats values > 0.5 as 1 and <= 0.5 as 0, then counts differences.
@@ -222,6 +288,16 @@ mod tests {
         assert!((cosine_distance(&a, &b) - 2.0).abs() < 1e-6);
     }
 
+    #[test]
+    fn test_cosine_distance_zero_vector() {
+        let zero = [0.0, 0.0, 0.0];
+        let a = [1.0, 2.0, 3.0];
+        assert_eq!(cosine_distance(&zero, &a), 1.0);
+        assert_eq!(cosine_distance(&a, &zero), 1.0);
+        assert_eq!(cosine_distance(&zero, &zero), 1.0);
+        assert_eq!(DistanceMetric::Cosine.compute(&zero, &a), 1.0);
+    }
+
     #[test]
     fn test_dot_product() {
         let a = [1.0, 2.0, 3.0];
@@ -245,6 +321,21 @@ mod tests {
         assert!((DistanceMetric::Euclidean.compute(&a, &b) - 5.0).abs() < 1e-6);
     }
 
+    #[test]
+    fn test_distance_fn_matches_compute() {
+        let a = [1.0, 2.0, 3.0];
+        let b = [-4.0, 5.0, 0.5];
+
+        for metric in [
+            DistanceMetric::Euclidean,
+            DistanceMetric::Cosine,
+            DistanceMetric::DotProduct,
+            DistanceMetric::Hamming,
+        ] {
+            assert_eq!(metric.distance_fn()(&a, &b), metric.compute(&a, &b));
+        }
+    }
+
     #[test]
     fn test_all_metrics_lower_is_better() {
         assert!(DistanceMetric::Euclidean.lower_is_better());
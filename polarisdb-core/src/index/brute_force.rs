@@ -9,7 +9,7 @@
 use std::cmp::Ordering;
 use std::collections::HashMap;
 
-use crate::distance::DistanceMetric;
+use crate::distance::{DistanceFn, DistanceMetric};
 use crate::error::{Error, Result};
 use crate::filter::Filter;
 use crate::payload::Payload;
@@ -101,6 +101,8 @@ pub struct BruteForceIndex {
     dimension: usize,
     /// The distance metric to use.
     metric: DistanceMetric,
+    /// Distance kernel for `metric`, resolved once at construction.
+    dist_fn: DistanceFn,
     /// Stored vectors indexed by ID.
     vectors: HashMap<VectorId, VectorEntry>,
     /// Next auto-generated ID (if not specified).
@@ -118,6 +120,7 @@ impl BruteForceIndex {
         Self {
             dimension,
             metric,
+            dist_fn: metric.distance_fn(),
             vectors: HashMap::new(),
             next_id: 1,
         }
@@ -258,6 +261,7 @@ impl BruteForceIndex {
         }
 
         // Collect all matching vectors with their distances
+        let dist_fn = self.dist_fn;
         let mut candidates: Vec<SearchResult> = self
             .vectors
             .iter()
@@ -268,7 +272,7 @@ impl BruteForceIndex {
                     .unwrap_or(true)
             })
             .map(|(&id, entry)| {
-                let distance = self.metric.compute(query, entry.vector.as_slice());
+                let distance = dist_fn(query, entry.vector.as_slice());
                 SearchResult::new(id, distance, Some(entry.payload.clone()))
             })
             .collect();
@@ -19,7 +19,7 @@ use std::collections::{BinaryHeap, HashMap, HashSet};
 
 use rand::Rng;
 
-use crate::distance::DistanceMetric;
+use crate::distance::{DistanceFn, DistanceMetric};
 use crate::error::{Error, Result};
 use crate::filter::Filter;
 use crate::payload::Payload;
@@ -183,6 +183,8 @@ pub struct HnswIndex {
     dimension: usize,
     /// Distance metric.
     metric: DistanceMetric,
+    /// Distance kernel for `metric`, resolved once at construction.
+    dist_fn: DistanceFn,
     /// Configuration.
     config: HnswConfig,
     /// Level generation multiplier (1/ln(M)).
@@ -204,6 +206,7 @@ impl HnswIndex {
         Self {
             dimension,
             metric,
+            dist_fn: metric.distance_fn(),
             config,
             ml,
             entry_point: None,
@@ -247,7 +250,7 @@ impl HnswIndex {
     #[inline]
     fn distance(&self, query: &[f32], node_id: VectorId) -> f32 {
         let node = &self.nodes[&node_id];
-        self.metric.compute(query, node.vector.as_slice())
+        (self.dist_fn)(query, node.vector.as_slice())
     }
 
     /// Inserts a vector into the index.
@@ -324,9 +327,8 @@ impl HnswIndex {
                     let neighbor_neighbors: Vec<_> = neighbor_neighbor_ids
                         .iter()
                         .map(|&nid| {
-                            let dist = self
-                                .metric
-                                .compute(&neighbor_vec, self.nodes[&nid].vector.as_slice());
+                            let dist =
+                                (self.dist_fn)(&neighbor_vec, self.nodes[&nid].vector.as_slice());
                             Candidate {
                                 id: nid,
                                 distance: dist,
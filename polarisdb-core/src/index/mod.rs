@@ -2,3 +2,4 @@
 
 pub mod brute_force;
 pub mod hnsw;
+pub mod quantized;
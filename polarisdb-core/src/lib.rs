@@ -8,6 +8,8 @@
 //! ## Crate Features
 //!
 //! - `async` - Enables [`AsyncCollection`] for tokio-compatible async operations
+//! - `simd` - Routes distance kernels through [SimSIMD](https://github.com/ashvardanian/SimSIMD)
+//!   (AVX2/AVX-512/NEON with runtime dispatch)
 //!
 //! ## Core Types
 //!
@@ -15,6 +17,7 @@
 //!
 //! - [`BruteForceIndex`] - Exact nearest neighbor search, O(n) complexity
 //! - [`HnswIndex`] - Approximate nearest neighbor using HNSW graphs, O(log n)
+//! - [`QuantizedIndex`] - Exact search over int8-quantized vectors, 4x less memory
 //!
 //! ### Persistence
 //!
@@ -46,11 +49,12 @@ pub mod vector;
 #[cfg(feature = "async")]
 pub use collection::AsyncCollection;
 pub use collection::{Collection, CollectionConfig};
-pub use distance::{Distance, DistanceMetric};
+pub use distance::{Distance, DistanceFn, DistanceMetric};
 pub use error::{Error, Result};
 pub use filter::{BitmapIndex, Filter, FilterCondition};
 pub use index::brute_force::{BruteForceIndex, SearchResult};
 pub use index::hnsw::{HnswConfig, HnswIndex};
+pub use index::quantized::QuantizedIndex;
 pub use payload::Payload;
 pub use vector::{Vector, VectorId};
 
@@ -68,6 +72,6 @@ pub use vector::{Vector, VectorId};
 pub mod prelude {
     pub use crate::{
         BitmapIndex, BruteForceIndex, Collection, CollectionConfig, Distance, DistanceMetric,
-        Error, Filter, HnswConfig, HnswIndex, Payload, Result, Vector, VectorId,
+        Error, Filter, HnswConfig, HnswIndex, Payload, QuantizedIndex, Result, Vector, VectorId,
     };
 }
@@ -1,3 +1,3 @@
 from ._polarisdb import *
 
-__all__ = ["Index", "Collection"]
+__all__ = ["Index", "Collection", "QuantizedIndex", "batch_cosine", "batch_distance"]
@@ -18,9 +18,24 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import heapq
+import inspect
+import itertools
+import json
+import mmap
+import os
+import sqlite3
+import threading
 import uuid
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Iterable, List, Optional, Tuple, Type
 
+import numpy as np
+
 try:
     from langchain_core.documents import Document
     from langchain_core.embeddings import Embeddings
@@ -31,7 +46,90 @@ except ImportError:
         "Install it with: pip install langchain-core"
     )
 
-from polarisdb import Collection, Index
+from polarisdb import Collection, Index, QuantizedIndex, batch_distance
+
+# Rows per int8 quantization block are sized to keep a block in L2 cache
+_QUANTIZE_BLOCK_BYTES = 256 * 1024
+
+
+def _import_pyarrow() -> Any:
+    """Import pyarrow, which persistent stores use to keep documents on disk."""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required to persist documents with collection_path. "
+            "Install it with: pip install polarisdb[arrow]"
+        )
+    return pyarrow
+
+
+def _embedding_fingerprint(embedding: Embeddings) -> str:
+    """Best-effort identifier of the model and output size of an embedder."""
+    embedding_type = type(embedding)
+    parts = [f"{embedding_type.__module__}.{embedding_type.__qualname__}"]
+    for attr in ("model", "model_name", "dimensions"):
+        value = getattr(embedding, attr, None)
+        if value is not None:
+            parts.append(f"{attr}={value}")
+    return ";".join(parts)
+
+
+class _EmbedCache:
+    """On-disk embedding cache keyed by ``sha256(fingerprint + text)``.
+
+    Vectors are stored as raw float32 bytes in a SQLite table, so texts
+    that were embedded before (by this or an earlier process) skip the
+    embedding call.
+    """
+
+    # Keys per SELECT, below SQLite's bound-parameter limit
+    _LOOKUP_BATCH = 500
+
+    def __init__(self, path: str, model: str):
+        self._prefix = hashlib.sha256(model.encode() + b"\0")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+            )
+
+    def key(self, text: str) -> bytes:
+        """Return the cache key of ``text``."""
+        digest = self._prefix.copy()
+        digest.update(text.encode())
+        return digest.digest()
+
+    def get_many(self, keys: List[bytes]) -> List[Optional[np.ndarray]]:
+        """Return the cached vector for each key, or None on a miss."""
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), self._LOOKUP_BATCH):
+                batch = keys[start : start + self._LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vec FROM embeddings WHERE key IN ({placeholders})",
+                    batch,
+                )
+                found.update(rows)
+        return [
+            np.frombuffer(found[key], dtype=np.float32) if key in found else None
+            for key in keys
+        ]
+
+    def put_many(self, keys: List[bytes], vectors: List[List[float]]) -> None:
+        """Store ``vectors`` under ``keys``."""
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in zip(keys, vectors)
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)", rows
+            )
 
 
 class PolarisDBVectorStore(VectorStore):
@@ -39,11 +137,35 @@ class PolarisDBVectorStore(VectorStore):
     
     Supports both in-memory (Index) and persistent (Collection) backends.
     
+    Added vectors are staged in memory and moved into the backend in one
+    bulk insert once ``staging_threshold`` vectors are pending, or on
+    ``flush()``. Staged vectors are still searched (by exact scan). Call
+    ``flush()`` (or use the store as a context manager) to make writes to
+    a persistent collection durable.
+    
+    Persistent stores also write each flushed batch of documents to an
+    Arrow segment in ``collection_path``. Reopening the store memory-maps
+    the segments, so documents are paged in only when a search returns
+    them. This requires ``pyarrow``; without it the store warns and keeps
+    documents in memory only.
+    
     Args:
         collection_path: Path for persistent storage. If None, uses in-memory index.
         embedding: Embedding model for encoding texts.
-        dimension: Vector dimension (required for in-memory mode).
+        dimension: Vector dimension. If None, it is read from an existing
+            collection's metadata or taken from the first embedding added.
         metric: Distance metric ("cosine", "euclidean", "dot").
+        query_cache_size: Number of query embeddings to memoize (0 disables).
+        quantization: Set to "int8" to store vectors as int8 codes (4x less
+            memory). Scales are fitted on the first batch of texts added.
+            Only supported for in-memory stores.
+        staging_threshold: Number of staged vectors that triggers a bulk
+            insert into the backend (0 inserts immediately).
+        prewarm: Read an existing collection's memory-mapped document
+            segments once at open, so the first searches do not page them
+            in. This makes opening slower and keeps the documents resident.
+        embedding_cache_path: SQLite file caching document embeddings by
+            embedder and text. Texts found there are not embedded again.
     """
 
     def __init__(
@@ -52,29 +174,164 @@ class PolarisDBVectorStore(VectorStore):
         collection_path: Optional[str] = None,
         dimension: Optional[int] = None,
         metric: str = "cosine",
+        query_cache_size: int = 1024,
+        quantization: Optional[str] = None,
+        staging_threshold: int = 10_000,
+        prewarm: bool = False,
+        embedding_cache_path: Optional[str] = None,
     ):
+        if quantization not in (None, "int8"):
+            raise ValueError(f"Unsupported quantization: {quantization!r}")
+        if quantization and collection_path:
+            raise ValueError("int8 quantization is only supported for in-memory stores")
+
         self._embedding = embedding
         self._metric = metric
         self._collection_path = collection_path
-        self._documents: dict[int, Document] = {}
+        self._quantization = quantization
+        self._scales: Optional[np.ndarray] = None
+        # Document fields stored column-wise. Ids below _persisted_count live
+        # in the memory-mapped Arrow table, the rest in the lists at
+        # doc_id - _persisted_count. Stores that write segments hold metadata
+        # already JSON-encoded, so it reads back the same before and after a
+        # flush.
+        self._contents: list[str] = []
+        self._metadatas: list[Any] = []
+        self._doc_table: Any = None
+        self._persisted_count = 0
         self._next_id = 0
+        # Without pyarrow a persistent store still keeps its vectors on disk,
+        # but documents live only in memory, as they did before segments
+        self._persist_docs = False
+        if collection_path:
+            try:
+                _import_pyarrow()
+            except ImportError as exc:
+                warnings.warn(
+                    f"{exc}. Until then, documents are kept in memory only and "
+                    "are not available after reopening the collection.",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+            else:
+                self._persist_docs = True
+                self._load_documents()
+
+        # Vectors waiting for a bulk insert into the backend, as (ids, vectors)
+        # chunks so a staged row never depends on how many ids came after it.
+        # The lock guards them together with id reservation and the document
+        # columns; it is re-entrant because adds drain at the threshold.
+        self._staging_threshold = staging_threshold
+        self._staging_lock = threading.RLock()
+        self._pending: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._pending_count = 0
+
+        # Per-thread float32 buffer reused for every query
+        self._local = threading.local()
+
+        # Persist document embeddings across runs if requested
+        self._embed_cache = (
+            _EmbedCache(embedding_cache_path, _embedding_fingerprint(embedding))
+            if embedding_cache_path
+            else None
+        )
+
+        # Memoize query embeddings so repeated questions skip the embedding call
+        self._embed_query_cached = functools.lru_cache(maxsize=query_cache_size)(
+            self._embedding.embed_query
+        )
 
-        # Determine dimension from embedding if not provided
-        if dimension is None:
-            test_embedding = self._embedding.embed_query("test")
-            dimension = len(test_embedding)
+        # Resolve the dimension without an embedding call where possible
+        if dimension is None and collection_path:
+            dimension = self._stored_dimension(collection_path)
         
         self._dimension = dimension
+        self._is_persistent = bool(collection_path)
 
-        # Create backend
-        if collection_path:
+        # Create backend; deferred to the first insert while the dimension
+        # (or the int8 scales) are still unknown
+        if dimension is None or quantization:
+            self._backend = None
+        elif collection_path:
             self._backend = Collection.open_or_create(
                 collection_path, dimension, metric
             )
-            self._is_persistent = True
         else:
             self._backend = Index(metric, dimension)
-            self._is_persistent = False
+
+        if prewarm and collection_path:
+            self._prewarm()
+
+    def _prewarm(self) -> None:
+        """Page the memory-mapped document segments into memory."""
+        if self._doc_table is not None:
+            for column in self._doc_table.columns:
+                for chunk in column.chunks:
+                    for buf in chunk.buffers():
+                        if buf is not None:
+                            # One byte per page faults the mapping in sequentially
+                            np.frombuffer(buf, dtype=np.uint8)[:: mmap.PAGESIZE].sum()
+
+    @staticmethod
+    def _stored_dimension(collection_path: str) -> Optional[int]:
+        """Read the vector dimension from an existing collection's metadata."""
+        meta_path = os.path.join(collection_path, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path) as f:
+            return json.load(f)["dimension"]
+
+    def _load_documents(self) -> None:
+        """Memory-map the document segments of an existing collection."""
+        if os.path.isdir(self._collection_path):
+            names = sorted(
+                name
+                for name in os.listdir(self._collection_path)
+                if name.startswith("documents-") and name.endswith(".arrow")
+            )
+            for name in names:
+                self._map_segment(os.path.join(self._collection_path, name))
+        self._next_id = self._persisted_count
+
+    def _map_segment(self, path: str) -> None:
+        """Append a memory-mapped document segment to the persisted table."""
+        pa = _import_pyarrow()
+        table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        if self._doc_table is None:
+            self._doc_table = table
+        else:
+            self._doc_table = pa.concat_tables([self._doc_table, table])
+        self._persisted_count += table.num_rows
+
+    def _persist_documents(self) -> None:
+        """Write documents added since the last flush as a new Arrow segment."""
+        if not self._contents:
+            return
+        
+        pa = _import_pyarrow()
+        table = pa.table({
+            "content": pa.array(self._contents, type=pa.string()),
+            "metadata": pa.array(self._metadatas, type=pa.string()),
+        })
+        # Segments are named by their first doc_id so they sort in id order.
+        # The first segment can precede the collection, so create its directory.
+        os.makedirs(self._collection_path, exist_ok=True)
+        path = os.path.join(
+            self._collection_path, f"documents-{self._persisted_count:012d}.arrow"
+        )
+        with pa.OSFile(path + ".tmp", "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(path + ".tmp", path)
+        
+        self._map_segment(path)
+        self._contents = []
+        self._metadatas = []
+
+    @staticmethod
+    def _as_list(texts: Iterable[str]) -> List[str]:
+        """Return ``texts`` as a list, copying only if it is not one already."""
+        return texts if isinstance(texts, list) else list(texts)
 
     @property
     def embeddings(self) -> Embeddings:
@@ -85,6 +342,8 @@ class PolarisDBVectorStore(VectorStore):
         self,
         texts: Iterable[str],
         metadatas: Optional[List[dict]] = None,
+        n_threads: Optional[int] = None,
+        chunk_size: int = 256,
         **kwargs: Any,
     ) -> List[str]:
         """Add texts to the vector store.
@@ -92,36 +351,328 @@ class PolarisDBVectorStore(VectorStore):
         Args:
             texts: Texts to add.
             metadatas: Optional metadata for each text.
+            n_threads: Number of threads embedding chunks concurrently.
+                None or 1 embeds everything in a single request.
+            chunk_size: Number of texts per embedding request when threaded.
             
         Returns:
             List of IDs for the added texts.
         """
-        texts_list = list(texts)
-        embeddings = self._embedding.embed_documents(texts_list)
+        texts_list = self._as_list(texts)
+        if self._embed_cache is None:
+            embeddings = self._embed_documents(texts_list, n_threads, chunk_size)
+        else:
+            keys, embeddings, misses = self._cache_lookup(texts_list)
+            while misses:
+                computed = self._embed_documents(
+                    [texts_list[i] for i in misses], n_threads, chunk_size
+                )
+                misses = self._cache_fill(keys, embeddings, misses, computed)
+        return self._add_embeddings(texts_list, embeddings, metadatas)
+
+    def _embed_documents(
+        self,
+        texts_list: List[str],
+        n_threads: Optional[int] = None,
+        chunk_size: int = 256,
+    ) -> List[List[float]]:
+        """Embed texts, fanning chunks out over a thread pool if requested."""
+        if not n_threads or n_threads <= 1 or len(texts_list) <= chunk_size:
+            return self._embedding.embed_documents(texts_list)
         
-        if metadatas is None:
-            metadatas = [{} for _ in texts_list]
+        chunks = [
+            texts_list[i : i + chunk_size]
+            for i in range(0, len(texts_list), chunk_size)
+        ]
+        with ThreadPoolExecutor(max_workers=n_threads) as pool:
+            results = pool.map(self._embedding.embed_documents, chunks)
+            return [vector for chunk in results for vector in chunk]
+
+    async def aadd_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[List[dict]] = None,
+        chunk_size: int = 256,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Add texts to the vector store, embedding chunks concurrently.
+        
+        Texts are split into chunks of ``chunk_size`` whose embedding
+        requests run concurrently, so their network round-trips overlap.
         
-        ids = []
-        for text, embedding, metadata in zip(texts_list, embeddings, metadatas):
-            doc_id = self._next_id
-            self._next_id += 1
+        Args:
+            texts: Texts to add.
+            metadatas: Optional metadata for each text.
+            chunk_size: Number of texts per embedding request.
             
-            # Store document for retrieval
-            self._documents[doc_id] = Document(
-                page_content=text,
-                metadata=metadata,
+        Returns:
+            List of IDs for the added texts.
+        """
+        texts_list = self._as_list(texts)
+        if self._embed_cache is None:
+            embeddings = await self._aembed_documents(texts_list, chunk_size)
+        else:
+            keys, embeddings, misses = self._cache_lookup(texts_list)
+            while misses:
+                computed = await self._aembed_documents(
+                    [texts_list[i] for i in misses], chunk_size
+                )
+                misses = self._cache_fill(keys, embeddings, misses, computed)
+        return self._add_embeddings(texts_list, embeddings, metadatas)
+
+    async def _aembed_documents(
+        self, texts_list: List[str], chunk_size: int = 256
+    ) -> List[List[float]]:
+        """Embed texts with one concurrent request per chunk."""
+        chunks = [
+            texts_list[i : i + chunk_size]
+            for i in range(0, len(texts_list), chunk_size)
+        ]
+        results = await asyncio.gather(
+            *(self._embedding.aembed_documents(chunk) for chunk in chunks)
+        )
+        return [vector for chunk in results for vector in chunk]
+
+    def _cache_lookup(
+        self, texts_list: List[str]
+    ) -> Tuple[List[bytes], List[Any], List[int]]:
+        """Fetch cached embeddings; returns keys, embeddings and miss indices.
+
+        Hits whose length differs from the store's dimension count as misses.
+        """
+        keys = [self._embed_cache.key(text) for text in texts_list]
+        embeddings = self._embed_cache.get_many(keys)
+        misses = [
+            i
+            for i, vector in enumerate(embeddings)
+            if vector is None
+            or (self._dimension is not None and len(vector) != self._dimension)
+        ]
+        return keys, embeddings, misses
+
+    def _cache_fill(
+        self,
+        keys: List[bytes],
+        embeddings: List[Any],
+        misses: List[int],
+        computed: List[List[float]],
+    ) -> List[int]:
+        """Cache freshly computed embeddings and slot them into ``embeddings``.
+
+        Returns the indices of cached hits whose length differs from the
+        fresh vectors, which the caller embeds again.
+        """
+        self._embed_cache.put_many([keys[i] for i in misses], computed)
+        for i, vector in zip(misses, computed):
+            embeddings[i] = vector
+        
+        dimension = len(computed[0])
+        refreshed = set(misses)
+        return [
+            i
+            for i, vector in enumerate(embeddings)
+            if i not in refreshed and len(vector) != dimension
+        ]
+
+    def _add_embeddings(
+        self,
+        texts_list: List[str],
+        embeddings: List[List[float]],
+        metadatas: Optional[List[dict]] = None,
+    ) -> List[str]:
+        """Store texts with their precomputed embeddings."""
+        n = len(texts_list)
+        if metadatas is not None and len(metadatas) != n:
+            raise ValueError(
+                f"Got {len(metadatas)} metadatas for {n} texts; lengths must match"
             )
+        if metadatas is not None and self._persist_docs:
+            # Encode now so metadata JSON cannot represent (dates, sets, ...)
+            # raises TypeError here rather than failing or changing at flush
+            metadatas = [json.dumps(m) if m else None for m in metadatas]
+        if n:
+            # Validate the batch before any id is reserved
+            vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+            if vectors.ndim != 2 or vectors.shape[0] != n:
+                raise ValueError(
+                    f"Expected {n} embeddings as a 2-D array, got shape {vectors.shape}"
+                )
+        
+        with self._staging_lock:
+            if n:
+                if self._dimension is None:
+                    self._dimension = vectors.shape[1]
+                elif vectors.shape[1] != self._dimension:
+                    raise ValueError(
+                        f"Embedding dimension {vectors.shape[1]} does not match "
+                        f"store dimension {self._dimension}"
+                    )
+            start = self._next_id
+            self._next_id += n
             
-            # Insert into PolarisDB
-            self._backend.insert(doc_id, embedding)
-            ids.append(str(doc_id))
+            # Store document fields for retrieval
+            self._contents.extend(texts_list)
+            if metadatas is None:
+                # Missing metadata is stored as None and read back as {}
+                self._metadatas.extend(itertools.repeat(None, n))
+            else:
+                self._metadatas.extend(metadatas)
+            
+            # Stage vectors; the backend receives them in bulk
+            if n:
+                ids = np.arange(start, start + n, dtype=np.uint64)
+                self._pending.append((ids, vectors))
+                self._pending_count += n
+                if self._pending_count >= self._staging_threshold:
+                    self._drain_pending()
         
-        # Flush if persistent
+        return [str(doc_id) for doc_id in range(start, start + n)]
+
+    def flush(self) -> None:
+        """Insert all staged vectors and persist them if the store is persistent."""
+        self._drain_pending()
+
+    def __enter__(self) -> "PolarisDBVectorStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
+    def __del__(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+    def _pending_matrix(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Return staged ids and vectors as single arrays, compacting the chunks.
+
+        Returns None when nothing is staged, e.g. after a concurrent drain.
+        """
+        with self._staging_lock:
+            if len(self._pending) > 1:
+                ids, vectors = zip(*self._pending)
+                self._pending = [(np.concatenate(ids), np.concatenate(vectors))]
+            return self._pending[0] if self._pending else None
+
+    def _drain_pending(self) -> None:
+        """Move staged vectors into the backend with one bulk insert.
+
+        Persistent stores first write any unsaved documents (``_contents``)
+        as a segment, then log the vectors and checkpoint the collection, so
+        a vector that reaches the WAL always has its document on disk. A
+        failed insert leaves the vectors staged for the next flush.
+        """
+        with self._staging_lock:
+            dirty = bool(self._pending_count or self._contents)
+            if self._persist_docs and self._contents:
+                self._persist_documents()
+            
+            if self._pending_count:
+                self._insert_vectors(*self._pending_matrix())
+                self._pending = []
+                self._pending_count = 0
+            
+            # Flush if persistent
+            if self._is_persistent and dirty:
+                self._backend.flush()
+
+    def _merge_pending(
+        self,
+        query: np.ndarray,
+        results: Iterable[Tuple[int, float]],
+        k: int,
+    ) -> List[Tuple[int, float]]:
+        """Scan staged vectors for ``query`` and merge them into ``results``.
+
+        Both sources stream through a bounded max-heap of size ``k`` keyed on
+        negated distance, so only the current top ``k`` is ever held.
+        """
+        staged = self._pending_matrix()
+        if staged is None:
+            return list(results)
+        ids, vectors = staged
+        distances = batch_distance(query, vectors, self._metric)
+        if k < len(distances):
+            nearest = np.argpartition(distances, k)[:k]
+        else:
+            nearest = range(len(distances))
+
+        heap: List[Tuple[float, int]] = []
+        candidates = itertools.chain(
+            results,
+            ((int(ids[i]), float(distances[i])) for i in nearest),
+        )
+        for doc_id, distance in candidates:
+            if len(heap) < k:
+                heapq.heappush(heap, (-distance, doc_id))
+            elif -distance > heap[0][0]:
+                heapq.heapreplace(heap, (-distance, doc_id))
+        return [(doc_id, -neg) for neg, doc_id in sorted(heap, reverse=True)]
+
+    def _create_backend(self, vectors: np.ndarray) -> None:
+        """Create the deferred backend from the first batch of vectors."""
         if self._is_persistent:
-            self._backend.flush()
+            self._backend = Collection.open_or_create(
+                self._collection_path, self._dimension, self._metric
+            )
+        elif self._quantization:
+            self._scales = self._fit_scales(vectors)
+            self._backend = QuantizedIndex(self._metric, self._dimension, self._scales)
+        else:
+            self._backend = Index(self._metric, self._dimension)
+
+    def _insert_vectors(self, ids: np.ndarray, vectors: np.ndarray) -> None:
+        """Insert a float32 batch into the backend, quantizing if enabled."""
+        if self._backend is None:
+            self._create_backend(vectors)
+        
+        if not self._quantization:
+            self._backend.insert_many(ids, vectors)
+            return
+        
+        self._backend.insert_many_i8(ids, self._quantize(vectors))
+
+    def _fit_scales(self, vectors: np.ndarray) -> np.ndarray:
+        """Fit symmetric per-dimension int8 scales on the first batch."""
+        magnitudes = np.abs(vectors)
+        if self._metric == "cosine":
+            # Cosine codes are quantized from unit vectors, so fit on those
+            magnitudes /= self._row_norms(vectors)
+        scales = magnitudes.max(axis=0) / 127.0
+        scales[scales == 0] = 1.0
+        return scales.astype(np.float32)
+
+    def _quantize(self, vectors: np.ndarray) -> np.ndarray:
+        """Quantize float32 rows to int8 codes in one blocked pass.
+        
+        Each block of rows is scaled, normalized (for cosine), rounded and
+        clipped in a reused scratch buffer while it is still in cache, then
+        cast straight into the preallocated output.
+        """
+        n, dim = vectors.shape
+        codes = np.empty((n, dim), dtype=np.int8)
+        block_rows = max(1, _QUANTIZE_BLOCK_BYTES // (4 * dim))
+        scratch = np.empty((min(block_rows, n), dim), dtype=np.float32)
+        inv_scales = (1.0 / self._scales).astype(np.float32)
         
-        return ids
+        for start in range(0, n, block_rows):
+            block = vectors[start : start + block_rows]
+            buf = scratch[: len(block)]
+            np.multiply(block, inv_scales, out=buf)
+            if self._metric == "cosine":
+                np.divide(buf, self._row_norms(block), out=buf)
+            np.rint(buf, out=buf)
+            np.clip(buf, -127, 127, out=buf)
+            np.copyto(codes[start : start + len(block)], buf, casting="unsafe")
+        return codes
+
+    @staticmethod
+    def _row_norms(vectors: np.ndarray) -> np.ndarray:
+        """Return L2 norms of ``vectors`` as a column, with zeros replaced by 1."""
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return norms
 
     def similarity_search(
         self,
@@ -156,15 +707,95 @@ class PolarisDBVectorStore(VectorStore):
         Returns:
             List of (document, score) tuples.
         """
-        query_embedding = self._embedding.embed_query(query)
-        results = self._backend.search(query_embedding, k)
+        if self._backend is None and not self._pending_count:
+            return []
         
-        documents_with_scores = []
-        for doc_id, score in results:
-            if doc_id in self._documents:
-                documents_with_scores.append((self._documents[doc_id], score))
+        query_buf = self._query_buffer()
+        query_buf[:] = self._embed_query_cached(query)
+        if self._backend is not None:
+            # Parallel NumPy arrays; hits are converted to Python numbers
+            # only as documents are built
+            ids, distances = self._backend.search_arrays(query_buf, k)
+            results = zip(ids, distances)
+        else:
+            results = []
+        if self._pending_count:
+            results = self._merge_pending(query_buf, results, k)
+        return self._to_documents(results)
+
+    def _query_buffer(self) -> np.ndarray:
+        """Return this thread's reusable float32 query buffer."""
+        query_buf = getattr(self._local, "query_buf", None)
+        if query_buf is None:
+            query_buf = np.empty(self._dimension, dtype=np.float32)
+            self._local.query_buf = query_buf
+        return query_buf
+
+    def similarity_search_many(
+        self,
+        queries: List[str],
+        k: int = 4,
+        **kwargs: Any,
+    ) -> List[List[Tuple[Document, float]]]:
+        """Search for similar documents for several queries at once.
+        
+        All queries are embedded with a single ``embed_documents`` call and
+        searched in parallel by the backend.
+        
+        Args:
+            queries: Query texts.
+            k: Number of results to return per query.
+            
+        Returns:
+            List of (document, score) tuples for each query.
+        """
+        if not queries:
+            return []
         
-        return documents_with_scores
+        query_matrix = np.ascontiguousarray(
+            self._embedding.embed_documents(queries), dtype=np.float32
+        )
+        if self._backend is not None:
+            results = self._backend.search_batch(query_matrix, k)
+        else:
+            results = [[] for _ in queries]
+        if self._pending_count:
+            results = [
+                self._merge_pending(query, hits, k)
+                for query, hits in zip(query_matrix, results)
+            ]
+        return [self._to_documents(hits) for hits in results]
+
+    def _to_documents(
+        self, results: Iterable[Tuple[int, float]]
+    ) -> List[Tuple[Document, float]]:
+        """Map backend (id, distance) pairs to stored documents."""
+        # Collections written outside this store can hold ids with no
+        # stored document; those hits are skipped
+        return [
+            (self._document(int(doc_id)), float(score))
+            for doc_id, score in results
+            if doc_id < self._next_id
+        ]
+
+    def _document(self, doc_id: int) -> Document:
+        """Build the Document stored under ``doc_id``."""
+        if doc_id < self._persisted_count:
+            # Only the k hits are materialized as Python objects
+            metadata = self._doc_table.column("metadata")[doc_id].as_py()
+            return Document(
+                page_content=self._doc_table.column("content")[doc_id].as_py(),
+                metadata=json.loads(metadata) if metadata else {},
+            )
+        offset = doc_id - self._persisted_count
+        metadata = self._metadatas[offset]
+        if metadata and self._persist_docs:
+            metadata = json.loads(metadata)
+        return Document(page_content=self._contents[offset], metadata=metadata or {})
+
+    def clear_query_cache(self) -> None:
+        """Clear the memoized query embeddings."""
+        self._embed_query_cached.cache_clear()
 
     @classmethod
     def from_texts(
@@ -174,6 +805,7 @@ class PolarisDBVectorStore(VectorStore):
         metadatas: Optional[List[dict]] = None,
         collection_path: Optional[str] = None,
         metric: str = "cosine",
+        n_threads: Optional[int] = None,
         **kwargs: Any,
     ) -> "PolarisDBVectorStore":
         """Create a PolarisDBVectorStore from texts.
@@ -184,6 +816,52 @@ class PolarisDBVectorStore(VectorStore):
             metadatas: Optional metadata for each text.
             collection_path: Path for persistent storage.
             metric: Distance metric.
+            n_threads: Threads used to embed the texts in chunks. None
+                embeds everything in a single request; opt in only for
+                thread-safe embedders.
+            **kwargs: Extra constructor arguments; others (such as the
+                ``ids`` LangChain may pass) are ignored.
+            
+        Returns:
+            Initialized PolarisDBVectorStore with texts added.
+        """
+        store = cls(
+            embedding=embedding,
+            collection_path=collection_path,
+            metric=metric,
+            **cls._constructor_kwargs(kwargs),
+        )
+        store.add_texts(texts, metadatas, n_threads=n_threads)
+        store.flush()
+        return store
+
+    @classmethod
+    def _constructor_kwargs(cls, kwargs: dict) -> dict:
+        """Keep only the keyword arguments accepted by the constructor."""
+        params = inspect.signature(cls.__init__).parameters
+        return {key: value for key, value in kwargs.items() if key in params}
+
+    @classmethod
+    async def afrom_texts(
+        cls: Type["PolarisDBVectorStore"],
+        texts: List[str],
+        embedding: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+        collection_path: Optional[str] = None,
+        metric: str = "cosine",
+        **kwargs: Any,
+    ) -> "PolarisDBVectorStore":
+        """Asynchronously create a PolarisDBVectorStore from texts.
+        
+        Args:
+            texts: List of texts to add.
+            embedding: Embedding model.
+            metadatas: Optional metadata for each text.
+            collection_path: Path for persistent storage.
+            metric: Distance metric.
+            **kwargs: Extra constructor arguments; others (such as the
+                ``ids`` LangChain's ``afrom_documents`` passes, or
+                ``n_threads``) are ignored.
             
         Returns:
             Initialized PolarisDBVectorStore with texts added.
@@ -192,8 +870,10 @@ class PolarisDBVectorStore(VectorStore):
             embedding=embedding,
             collection_path=collection_path,
             metric=metric,
+            **cls._constructor_kwargs(kwargs),
         )
-        store.add_texts(texts, metadatas)
+        await store.aadd_texts(texts, metadatas)
+        store.flush()
         return store
 
     @classmethod
@@ -203,6 +883,7 @@ class PolarisDBVectorStore(VectorStore):
         embedding: Embeddings,
         collection_path: Optional[str] = None,
         metric: str = "cosine",
+        n_threads: Optional[int] = None,
         **kwargs: Any,
     ) -> "PolarisDBVectorStore":
         """Create a PolarisDBVectorStore from documents.
@@ -212,6 +893,9 @@ class PolarisDBVectorStore(VectorStore):
             embedding: Embedding model.
             collection_path: Path for persistent storage.
             metric: Distance metric.
+            n_threads: Threads used to embed the documents in chunks. None
+                embeds everything in a single request; opt in only for
+                thread-safe embedders.
             
         Returns:
             Initialized PolarisDBVectorStore with documents added.
@@ -224,5 +908,6 @@ class PolarisDBVectorStore(VectorStore):
             metadatas=metadatas,
             collection_path=collection_path,
             metric=metric,
+            n_threads=n_threads,
             **kwargs,
         )
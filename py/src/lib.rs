@@ -1,14 +1,126 @@
 #![allow(clippy::useless_conversion)]
-use polarisdb_core::{BruteForceIndex, DistanceMetric, Payload};
+use std::borrow::Cow;
+
+use numpy::ndarray::ArrayView1;
+use numpy::{
+    AllowTypeChange, IntoPyArray, PyArray1, PyArrayLike1, PyArrayLike2, PyReadonlyArray1,
+    PyReadonlyArray2,
+};
+use parking_lot::RwLock;
+use polarisdb_core::{BruteForceIndex, DistanceMetric, Payload, SearchResult};
 use pyo3::prelude::*;
+use rayon::prelude::*;
+
+/// Parses a metric name as accepted by the Python API.
+fn parse_metric(metric: &str) -> PyResult<DistanceMetric> {
+    match metric {
+        "cosine" => Ok(DistanceMetric::Cosine),
+        "euclidean" => Ok(DistanceMetric::Euclidean),
+        "dot" => Ok(DistanceMetric::DotProduct),
+        _ => Err(pyo3::exceptions::PyValueError::new_err("Invalid metric")),
+    }
+}
+
+/// Borrows a NumPy row as a slice, copying only if it is strided.
+fn row_slice<'a>(row: &'a ArrayView1<'_, f32>) -> Cow<'a, [f32]> {
+    match row.as_slice() {
+        Some(slice) => Cow::Borrowed(slice),
+        None => Cow::Owned(row.to_vec()),
+    }
+}
+
+/// Parallel id and distance arrays returned by `search_arrays`.
+type SearchArrays<'py> = (Bound<'py, PyArray1<u64>>, Bound<'py, PyArray1<f32>>);
+
+/// Splits search results into parallel id and distance arrays.
+///
+/// The vectors are handed to NumPy without copying, so a search costs two
+/// array objects instead of a tuple, an int and a float per hit.
+fn results_to_arrays(py: Python<'_>, results: Vec<SearchResult>) -> SearchArrays<'_> {
+    let (ids, distances): (Vec<u64>, Vec<f32>) =
+        results.into_iter().map(|r| (r.id, r.distance)).unzip();
+    (ids.into_pyarray_bound(py), distances.into_pyarray_bound(py))
+}
+
+/// Computes `metric` distances from `query` to every row of `vectors`.
+///
+/// The distance loop runs with the GIL released.
+fn distances_to_rows(
+    py: Python<'_>,
+    query: PyReadonlyArray1<'_, f32>,
+    vectors: PyReadonlyArray2<'_, f32>,
+    metric: DistanceMetric,
+) -> PyResult<Vec<f32>> {
+    let query = query.as_array();
+    let query = row_slice(&query);
+    let vectors = vectors.as_array();
+    if query.len() != vectors.ncols() {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "query and vectors must have the same dimension",
+        ));
+    }
+    let dist_fn = metric.distance_fn();
+    Ok(py.allow_threads(|| {
+        vectors
+            .rows()
+            .into_iter()
+            .map(|row| dist_fn(&query, &row_slice(&row)))
+            .collect()
+    }))
+}
+
+#[pyfunction]
+/// Compute cosine distances from one query to many vectors.
+///
+/// Uses the same SIMD distance kernels as the indexes.
+///
+/// Args:
+///     query (numpy.ndarray): 1-D ``float32`` query vector.
+///     vectors (numpy.ndarray): 2-D ``float32`` array, one vector per row.
+///
+/// Returns:
+///     numpy.ndarray: 1-D ``float32`` array of cosine distances, one per row.
+fn batch_cosine<'py>(
+    py: Python<'py>,
+    query: PyReadonlyArray1<'py, f32>,
+    vectors: PyReadonlyArray2<'py, f32>,
+) -> PyResult<Bound<'py, PyArray1<f32>>> {
+    let distances = distances_to_rows(py, query, vectors, DistanceMetric::Cosine)?;
+    Ok(distances.into_pyarray_bound(py))
+}
+
+#[pyfunction]
+#[pyo3(signature = (query, vectors, metric = "cosine"))]
+/// Compute distances from one query to many vectors.
+///
+/// Distances follow the index convention: lower is more similar, and
+/// dot products are negated.
+///
+/// Args:
+///     query (numpy.ndarray): 1-D ``float32`` query vector.
+///     vectors (numpy.ndarray): 2-D ``float32`` array, one vector per row.
+///     metric (str): Distance metric ("cosine", "euclidean", "dot").
+///
+/// Returns:
+///     numpy.ndarray: 1-D ``float32`` array of distances, one per row.
+fn batch_distance<'py>(
+    py: Python<'py>,
+    query: PyReadonlyArray1<'py, f32>,
+    vectors: PyReadonlyArray2<'py, f32>,
+    metric: &str,
+) -> PyResult<Bound<'py, PyArray1<f32>>> {
+    let distances = distances_to_rows(py, query, vectors, parse_metric(metric)?)?;
+    Ok(distances.into_pyarray_bound(py))
+}
 
 #[pyclass]
 /// In-memory brute-force vector index.
 ///
 /// This index stores all vectors in memory and performs exhaustive search
-/// for exact nearest neighbors.
+/// for exact nearest neighbors. Searches and bulk inserts release the GIL,
+/// so several Python threads can use the same index concurrently.
 struct Index {
-    inner: BruteForceIndex,
+    inner: RwLock<BruteForceIndex>,
 }
 
 #[pymethods]
@@ -20,14 +132,9 @@ impl Index {
     ///     metric (str): Distance metric ("cosine", "euclidean", "dot").
     ///     dimension (int): Dimension of the vectors.
     fn new(metric: &str, dimension: usize) -> PyResult<Self> {
-        let metric = match metric {
-            "cosine" => DistanceMetric::Cosine,
-            "euclidean" => DistanceMetric::Euclidean,
-            "dot" => DistanceMetric::DotProduct,
-            _ => return Err(pyo3::exceptions::PyValueError::new_err("Invalid metric")),
-        };
+        let metric = parse_metric(metric)?;
         Ok(Index {
-            inner: BruteForceIndex::new(metric, dimension),
+            inner: RwLock::new(BruteForceIndex::new(metric, dimension)),
         })
     }
 
@@ -36,9 +143,10 @@ impl Index {
     /// Args:
     ///     id (int): Unique identifier for the vector.
     ///     vector (list[float]): The vector data.
-    fn insert(&mut self, id: u64, vector: Vec<f32>) -> PyResult<()> {
+    fn insert(&self, id: u64, vector: Vec<f32>) -> PyResult<()> {
         // Simple payload for now
         self.inner
+            .write()
             .insert(id, vector, Payload::new())
             .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
     }
@@ -46,13 +154,21 @@ impl Index {
     /// Search for nearest neighbors.
     ///
     /// Args:
-    ///     query (list[float]): The query vector.
+    ///     query (numpy.ndarray | list[float]): The query vector. A
+    ///         ``float32`` array is read in place without copying.
     ///     k (int): Number of neighbors to return.
     ///
     /// Returns:
     ///     list[tuple[int, float]]: List of (id, distance) tuples.
-    fn search(&self, query: Vec<f32>, k: usize) -> PyResult<Vec<(u64, f32)>> {
-        let results = self.inner.search(&query, k, None);
+    fn search(
+        &self,
+        py: Python<'_>,
+        query: PyArrayLike1<'_, f32, AllowTypeChange>,
+        k: usize,
+    ) -> PyResult<Vec<(u64, f32)>> {
+        let query = query.as_array();
+        let query = row_slice(&query);
+        let results = py.allow_threads(|| self.inner.read().search(&query, k, None));
         Ok(results.into_iter().map(|r| (r.id, r.distance)).collect())
     }
 
@@ -61,35 +177,101 @@ impl Index {
     /// Args:
     ///     ids (list[int]): List of unique identifiers.
     ///     vectors (list[list[float]]): List of vectors.
-    fn insert_batch(&mut self, ids: Vec<u64>, vectors: Vec<Vec<f32>>) -> PyResult<()> {
+    fn insert_batch(&self, ids: Vec<u64>, vectors: Vec<Vec<f32>>) -> PyResult<()> {
         if ids.len() != vectors.len() {
             return Err(pyo3::exceptions::PyValueError::new_err(
                 "ids and vectors must have the same length",
             ));
         }
+        let mut inner = self.inner.write();
         for (id, vector) in ids.into_iter().zip(vectors) {
-            self.inner
+            inner
                 .insert(id, vector, Payload::new())
                 .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
         }
         Ok(())
     }
 
+    /// Insert multiple vectors from NumPy arrays in a single call.
+    ///
+    /// The arrays are read in place, so no per-vector Python objects are
+    /// created on the way into the index.
+    ///
+    /// Args:
+    ///     ids (numpy.ndarray): 1-D ``uint64`` array of unique identifiers.
+    ///     vectors (numpy.ndarray): 2-D ``float32`` array, one vector per row.
+    fn insert_many(
+        &self,
+        py: Python<'_>,
+        ids: PyReadonlyArray1<'_, u64>,
+        vectors: PyReadonlyArray2<'_, f32>,
+    ) -> PyResult<()> {
+        let ids = ids.as_array();
+        let vectors = vectors.as_array();
+        if ids.len() != vectors.nrows() {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "ids and vectors must have the same length",
+            ));
+        }
+        py.allow_threads(|| {
+            let mut inner = self.inner.write();
+            ids.iter()
+                .zip(vectors.rows())
+                .try_for_each(|(&id, row)| inner.insert(id, row.to_vec(), Payload::new()))
+        })
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
+    }
+
+    /// Search for nearest neighbors, returning NumPy arrays.
+    ///
+    /// Args:
+    ///     query (numpy.ndarray | list[float]): The query vector. A
+    ///         ``float32`` array is read in place without copying.
+    ///     k (int): Number of neighbors to return.
+    ///
+    /// Returns:
+    ///     tuple[numpy.ndarray, numpy.ndarray]: ``uint64`` ids and
+    ///     ``float32`` distances, sorted by distance.
+    fn search_arrays<'py>(
+        &self,
+        py: Python<'py>,
+        query: PyArrayLike1<'py, f32, AllowTypeChange>,
+        k: usize,
+    ) -> PyResult<SearchArrays<'py>> {
+        let query = query.as_array();
+        let query = row_slice(&query);
+        let results = py.allow_threads(|| self.inner.read().search(&query, k, None));
+        Ok(results_to_arrays(py, results))
+    }
+
     /// Search for nearest neighbors for multiple queries.
     ///
+    /// Queries are searched in parallel across all cores.
+    ///
     /// Args:
-    ///     queries (list[list[float]]): List of query vectors.
+    ///     queries (numpy.ndarray | list[list[float]]): 2-D array of query
+    ///         vectors, one per row.
     ///     k (int): Number of neighbors per query.
     ///
     /// Returns:
     ///     list[list[tuple[int, float]]]: Results for each query.
-    fn search_batch(&self, queries: Vec<Vec<f32>>, k: usize) -> PyResult<Vec<Vec<(u64, f32)>>> {
-        let mut all_results = Vec::with_capacity(queries.len());
-        for query in queries {
-            let results = self.inner.search(&query, k, None);
-            all_results.push(results.into_iter().map(|r| (r.id, r.distance)).collect());
-        }
-        Ok(all_results)
+    fn search_batch(
+        &self,
+        py: Python<'_>,
+        queries: PyArrayLike2<'_, f32, AllowTypeChange>,
+        k: usize,
+    ) -> PyResult<Vec<Vec<(u64, f32)>>> {
+        let queries = queries.as_array();
+        let rows: Vec<ArrayView1<'_, f32>> = queries.rows().into_iter().collect();
+        Ok(py.allow_threads(|| {
+            let inner = self.inner.read();
+            rows.par_iter()
+                .map(|row| {
+                    let results = inner.search(&row_slice(row), k, None);
+                    results.into_iter().map(|r| (r.id, r.distance)).collect()
+                })
+                .collect()
+        }))
     }
 }
 
@@ -97,7 +279,8 @@ impl Index {
 /// Persistent vector collection backed by disk storage.
 ///
 /// Stores vectors and metadata on disk with WAL (Write-Ahead Log) protection
-/// for durability. Supports crash recovery.
+/// for durability. Supports crash recovery. Searches, bulk inserts and
+/// flushes release the GIL.
 struct Collection {
     inner: polarisdb_core::Collection,
 }
@@ -112,12 +295,7 @@ impl Collection {
     ///     dimension (int): Dimension of the vectors (must match existing).
     ///     metric (str): Distance metric ("cosine", "euclidean", "dot").
     fn open_or_create(path: &str, dimension: usize, metric: &str) -> PyResult<Self> {
-        let metric = match metric {
-            "cosine" => DistanceMetric::Cosine,
-            "euclidean" => DistanceMetric::Euclidean,
-            "dot" => DistanceMetric::DotProduct,
-            _ => return Err(pyo3::exceptions::PyValueError::new_err("Invalid metric")),
-        };
+        let metric = parse_metric(metric)?;
         let config = polarisdb_core::CollectionConfig::new(dimension, metric);
         let collection = polarisdb_core::Collection::open_or_create(path, config)
             .map_err(|e| pyo3::exceptions::PyIOError::new_err(e.to_string()))?;
@@ -129,7 +307,7 @@ impl Collection {
     /// Args:
     ///     id (int): Unique identifier.
     ///     vector (list[float]): Vector data.
-    fn insert(&mut self, id: u64, vector: Vec<f32>) -> PyResult<()> {
+    fn insert(&self, id: u64, vector: Vec<f32>) -> PyResult<()> {
         self.inner
             .insert(id, vector, Payload::new())
             .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
@@ -138,22 +316,29 @@ impl Collection {
     /// Search for nearest neighbors.
     ///
     /// Args:
-    ///     query (list[float]): Query vector.
+    ///     query (numpy.ndarray | list[float]): The query vector. A
+    ///         ``float32`` array is read in place without copying.
     ///     k (int): Number of results.
     ///
     /// Returns:
     ///     list[tuple[int, float]]: List of (id, distance) tuples.
-    fn search(&self, query: Vec<f32>, k: usize) -> PyResult<Vec<(u64, f32)>> {
-        let results = self.inner.search(&query, k, None);
+    fn search(
+        &self,
+        py: Python<'_>,
+        query: PyArrayLike1<'_, f32, AllowTypeChange>,
+        k: usize,
+    ) -> PyResult<Vec<(u64, f32)>> {
+        let query = query.as_array();
+        let query = row_slice(&query);
+        let results = py.allow_threads(|| self.inner.search(&query, k, None));
         Ok(results.into_iter().map(|r| (r.id, r.distance)).collect())
     }
 
     /// Flush all pending writes to disk (checkpoint).
     ///
     /// This ensures all data is durable and truncates the WAL.
-    fn flush(&mut self) -> PyResult<()> {
-        self.inner
-            .flush()
+    fn flush(&self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| self.inner.flush())
             .map_err(|e| pyo3::exceptions::PyIOError::new_err(e.to_string()))
     }
 
@@ -162,7 +347,7 @@ impl Collection {
     /// Args:
     ///     ids (list[int]): List of unique identifiers.
     ///     vectors (list[list[float]]): List of vectors.
-    fn insert_batch(&mut self, ids: Vec<u64>, vectors: Vec<Vec<f32>>) -> PyResult<()> {
+    fn insert_batch(&self, ids: Vec<u64>, vectors: Vec<Vec<f32>>) -> PyResult<()> {
         if ids.len() != vectors.len() {
             return Err(pyo3::exceptions::PyValueError::new_err(
                 "ids and vectors must have the same length",
@@ -176,21 +361,225 @@ impl Collection {
         Ok(())
     }
 
+    /// Insert multiple vectors from NumPy arrays in a single call.
+    ///
+    /// The whole batch is written to the WAL and applied to the index
+    /// under one set of locks.
+    ///
+    /// Args:
+    ///     ids (numpy.ndarray): 1-D ``uint64`` array of unique identifiers.
+    ///     vectors (numpy.ndarray): 2-D ``float32`` array, one vector per row.
+    fn insert_many(
+        &self,
+        py: Python<'_>,
+        ids: PyReadonlyArray1<'_, u64>,
+        vectors: PyReadonlyArray2<'_, f32>,
+    ) -> PyResult<()> {
+        let ids = ids.as_array();
+        let vectors = vectors.as_array();
+        if ids.len() != vectors.nrows() {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "ids and vectors must have the same length",
+            ));
+        }
+        py.allow_threads(|| {
+            let entries = ids
+                .iter()
+                .zip(vectors.rows())
+                .map(|(&id, row)| (id, row.to_vec(), Payload::new()));
+            self.inner.insert_batch(entries)
+        })
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
+    }
+
+    /// Search for nearest neighbors, returning NumPy arrays.
+    ///
+    /// Args:
+    ///     query (numpy.ndarray | list[float]): The query vector. A
+    ///         ``float32`` array is read in place without copying.
+    ///     k (int): Number of neighbors to return.
+    ///
+    /// Returns:
+    ///     tuple[numpy.ndarray, numpy.ndarray]: ``uint64`` ids and
+    ///     ``float32`` distances, sorted by distance.
+    fn search_arrays<'py>(
+        &self,
+        py: Python<'py>,
+        query: PyArrayLike1<'py, f32, AllowTypeChange>,
+        k: usize,
+    ) -> PyResult<SearchArrays<'py>> {
+        let query = query.as_array();
+        let query = row_slice(&query);
+        let results = py.allow_threads(|| self.inner.search(&query, k, None));
+        Ok(results_to_arrays(py, results))
+    }
+
     /// Search for nearest neighbors for multiple queries.
     ///
+    /// Queries are searched in parallel across all cores, sharing the
+    /// collection's read lock.
+    ///
     /// Args:
-    ///     queries (list[list[float]]): List of query vectors.
+    ///     queries (numpy.ndarray | list[list[float]]): 2-D array of query
+    ///         vectors, one per row.
     ///     k (int): Number of neighbors per query.
     ///
     /// Returns:
     ///     list[list[tuple[int, float]]]: Results for each query.
-    fn search_batch(&self, queries: Vec<Vec<f32>>, k: usize) -> PyResult<Vec<Vec<(u64, f32)>>> {
-        let mut all_results = Vec::with_capacity(queries.len());
-        for query in queries {
-            let results = self.inner.search(&query, k, None);
-            all_results.push(results.into_iter().map(|r| (r.id, r.distance)).collect());
+    fn search_batch(
+        &self,
+        py: Python<'_>,
+        queries: PyArrayLike2<'_, f32, AllowTypeChange>,
+        k: usize,
+    ) -> PyResult<Vec<Vec<(u64, f32)>>> {
+        let queries = queries.as_array();
+        let rows: Vec<ArrayView1<'_, f32>> = queries.rows().into_iter().collect();
+        Ok(py.allow_threads(|| {
+            rows.par_iter()
+                .map(|row| {
+                    let results = self.inner.search(&row_slice(row), k, None);
+                    results.into_iter().map(|r| (r.id, r.distance)).collect()
+                })
+                .collect()
+        }))
+    }
+}
+
+#[pyclass]
+/// In-memory index over int8-quantized vectors.
+///
+/// Each dimension is stored as an int8 code with a symmetric scale
+/// (``x ≈ scale * code``), using 4x less memory than ``Index``. Queries
+/// stay in float32 and are scaled once per search.
+struct QuantizedIndex {
+    inner: RwLock<polarisdb_core::QuantizedIndex>,
+}
+
+#[pymethods]
+impl QuantizedIndex {
+    #[new]
+    /// Create a new quantized index.
+    ///
+    /// Args:
+    ///     metric (str): Distance metric ("cosine", "euclidean", "dot").
+    ///     dimension (int): Dimension of the vectors.
+    ///     scales (numpy.ndarray): 1-D ``float32`` per-dimension scales.
+    fn new(metric: &str, dimension: usize, scales: PyReadonlyArray1<'_, f32>) -> PyResult<Self> {
+        let metric = parse_metric(metric)?;
+        let scales = scales.as_array().to_vec();
+        let inner = polarisdb_core::QuantizedIndex::new(metric, dimension, scales)
+            .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
+        Ok(QuantizedIndex {
+            inner: RwLock::new(inner),
+        })
+    }
+
+    /// Insert multiple pre-quantized vectors in a single call.
+    ///
+    /// Args:
+    ///     ids (numpy.ndarray): 1-D ``uint64`` array of unique identifiers.
+    ///     codes (numpy.ndarray): 2-D ``int8`` array, one quantized vector per row.
+    fn insert_many_i8(
+        &self,
+        py: Python<'_>,
+        ids: PyReadonlyArray1<'_, u64>,
+        codes: PyReadonlyArray2<'_, i8>,
+    ) -> PyResult<()> {
+        let ids = ids.as_array();
+        let codes = codes.as_array();
+        if ids.len() != codes.nrows() {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "ids and codes must have the same length",
+            ));
         }
-        Ok(all_results)
+        py.allow_threads(|| {
+            let mut inner = self.inner.write();
+            ids.iter()
+                .zip(codes.rows())
+                .try_for_each(|(&id, row)| match row.as_slice() {
+                    Some(row) => inner.insert_codes(id, row),
+                    None => inner.insert_codes(id, &row.to_vec()),
+                })
+        })
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
+    }
+
+    /// Search for nearest neighbors.
+    ///
+    /// Args:
+    ///     query (numpy.ndarray | list[float]): The query vector. A
+    ///         ``float32`` array is read in place without copying.
+    ///     k (int): Number of neighbors to return.
+    ///
+    /// Returns:
+    ///     list[tuple[int, float]]: List of (id, distance) tuples.
+    fn search(
+        &self,
+        py: Python<'_>,
+        query: PyArrayLike1<'_, f32, AllowTypeChange>,
+        k: usize,
+    ) -> PyResult<Vec<(u64, f32)>> {
+        let query = query.as_array();
+        let query = row_slice(&query);
+        let results = py.allow_threads(|| self.inner.read().search(&query, k));
+        Ok(results.into_iter().map(|r| (r.id, r.distance)).collect())
+    }
+
+    /// Search for nearest neighbors, returning NumPy arrays.
+    ///
+    /// Args:
+    ///     query (numpy.ndarray | list[float]): The query vector. A
+    ///         ``float32`` array is read in place without copying.
+    ///     k (int): Number of neighbors to return.
+    ///
+    /// Returns:
+    ///     tuple[numpy.ndarray, numpy.ndarray]: ``uint64`` ids and
+    ///     ``float32`` distances, sorted by distance.
+    fn search_arrays<'py>(
+        &self,
+        py: Python<'py>,
+        query: PyArrayLike1<'py, f32, AllowTypeChange>,
+        k: usize,
+    ) -> PyResult<SearchArrays<'py>> {
+        let query = query.as_array();
+        let query = row_slice(&query);
+        let results = py.allow_threads(|| self.inner.read().search(&query, k));
+        Ok(results_to_arrays(py, results))
+    }
+
+    /// Search for nearest neighbors for multiple queries.
+    ///
+    /// Queries are searched in parallel across all cores.
+    ///
+    /// Args:
+    ///     queries (numpy.ndarray | list[list[float]]): 2-D array of query
+    ///         vectors, one per row.
+    ///     k (int): Number of neighbors per query.
+    ///
+    /// Returns:
+    ///     list[list[tuple[int, float]]]: Results for each query.
+    fn search_batch(
+        &self,
+        py: Python<'_>,
+        queries: PyArrayLike2<'_, f32, AllowTypeChange>,
+        k: usize,
+    ) -> PyResult<Vec<Vec<(u64, f32)>>> {
+        let queries = queries.as_array();
+        let rows: Vec<ArrayView1<'_, f32>> = queries.rows().into_iter().collect();
+        Ok(py.allow_threads(|| {
+            let inner = self.inner.read();
+            rows.par_iter()
+                .map(|row| {
+                    let results = inner.search(&row_slice(row), k);
+                    results.into_iter().map(|r| (r.id, r.distance)).collect()
+                })
+                .collect()
+        }))
+    }
+
+    /// Number of vectors in the index.
+    fn __len__(&self) -> usize {
+        self.inner.read().len()
     }
 }
 
@@ -198,5 +587,8 @@ impl Collection {
 fn _polarisdb(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<Index>()?;
     m.add_class::<Collection>()?;
+    m.add_class::<QuantizedIndex>()?;
+    m.add_function(wrap_pyfunction!(batch_cosine, m)?)?;
+    m.add_function(wrap_pyfunction!(batch_distance, m)?)?;
     Ok(())
 }
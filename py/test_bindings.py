@@ -1,3 +1,4 @@
+import numpy as np
 import polarisdb
 import time
 
@@ -30,6 +31,20 @@ def test_rust_bindings():
         print(f"   ID: {id}, Distance: {dist:.4f}")
 
     assert results[0][0] == 1, "Expected ID 1 to be closest"
+
+    # NumPy batch APIs
+    batch = polarisdb.Index("cosine", 3)
+    matrix = np.array([v for _, v in vectors], dtype=np.float32)
+    batch.insert_many(np.array([id for id, _ in vectors], dtype=np.uint64), matrix)
+    assert batch.search(query, 2) == results
+    ids, dists = batch.search_arrays(query, 2)
+    assert ids.dtype == np.uint64 and dists.dtype == np.float32
+    assert list(zip(ids.tolist(), dists.tolist())) == results
+    distances = polarisdb.batch_cosine(np.array(query, dtype=np.float32), matrix)
+    assert distances.shape == (len(vectors),)
+    assert int(np.argmin(distances)) == 0
+    print("[OK] insert_many / search_arrays / batch_cosine verified")
+
     # Collection (Persistent)
     print("\nTesting Persistent Collection...")
     import shutil
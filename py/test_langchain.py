@@ -0,0 +1,320 @@
+import asyncio
+import datetime
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from polarisdb import langchain
+from polarisdb.langchain import PolarisDBVectorStore
+
+TEXTS = [f"document number {i}" for i in range(40)]
+
+
+class FakeEmbeddings(Embeddings):
+    """Deterministic embeddings derived from a hash of the text."""
+
+    def __init__(self, dimension=8):
+        self.dimension = dimension
+        self.embedded = 0
+        self.queried = 0
+
+    def _embed(self, text):
+        seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:4], "little")
+        return np.random.default_rng(seed).normal(size=self.dimension).tolist()
+
+    def embed_documents(self, texts):
+        self.embedded += len(texts)
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text):
+        self.queried += 1
+        return self._embed(text)
+
+
+def assert_top_hit(store, text, metadata=None):
+    document, score = store.similarity_search_with_score(text, k=3)[0]
+    assert document.page_content == text
+    if metadata is not None:
+        assert document.metadata == metadata
+    assert isinstance(score, float)
+
+
+@pytest.mark.parametrize("staging_threshold", [0, 16, 10_000])
+def test_add_and_search_before_and_after_flush(staging_threshold):
+    store = PolarisDBVectorStore(FakeEmbeddings(), staging_threshold=staging_threshold)
+    assert store.similarity_search("anything") == []
+
+    ids = store.add_texts(TEXTS, [{"i": i} for i in range(len(TEXTS))])
+    assert ids == [str(i) for i in range(len(TEXTS))]
+    assert_top_hit(store, "document number 7", {"i": 7})
+
+    store.add_texts(["a late addition"])
+    assert_top_hit(store, "a late addition", {})
+
+    results = store.similarity_search_with_score("document number 3", k=5)
+    scores = [score for _, score in results]
+    assert len(results) == 5 and scores == sorted(scores)
+
+    store.flush()
+    assert_top_hit(store, "document number 7", {"i": 7})
+    assert_top_hit(store, "a late addition", {})
+
+
+def test_search_many_merges_staged_vectors():
+    store = PolarisDBVectorStore(FakeEmbeddings(), staging_threshold=30)
+    store.add_texts(TEXTS)
+    queries = ["document number 1", "document number 35"]
+    results = store.similarity_search_many(queries, k=2)
+    assert [hits[0][0].page_content for hits in results] == queries
+
+
+def test_repeated_queries_hit_the_query_cache():
+    embeddings = FakeEmbeddings()
+    store = PolarisDBVectorStore.from_texts(TEXTS, embeddings)
+    for _ in range(3):
+        assert_top_hit(store, "document number 6")
+    assert embeddings.queried == 1
+
+    store.clear_query_cache()
+    assert_top_hit(store, "document number 6")
+    assert embeddings.queried == 2
+
+
+def test_query_cache_can_be_disabled():
+    embeddings = FakeEmbeddings()
+    store = PolarisDBVectorStore.from_texts(TEXTS, embeddings, query_cache_size=0)
+    for _ in range(3):
+        assert_top_hit(store, "document number 6")
+    assert embeddings.queried == 3
+
+
+def test_document_columns_stay_aligned():
+    store = PolarisDBVectorStore(FakeEmbeddings())
+    with pytest.raises(ValueError):
+        store.add_texts(TEXTS[:3], [{"i": 0}])
+    assert store.add_texts(TEXTS[:2]) == ["0", "1"]
+
+    store.add_texts(TEXTS[2:4], [{"i": 2}, None])
+    assert len(store._contents) == len(store._metadatas) == 4
+    assert_top_hit(store, "document number 0", {})
+    assert_top_hit(store, "document number 2", {"i": 2})
+    assert_top_hit(store, "document number 3", {})
+
+
+class FlakyEmbeddings(FakeEmbeddings):
+    """Drops a vector from any batch that contains ``"drop me"``."""
+
+    def embed_documents(self, texts):
+        vectors = super().embed_documents(texts)
+        return vectors[1:] if "drop me" in texts else vectors
+
+
+def test_failed_add_does_not_shift_staged_ids():
+    store = PolarisDBVectorStore(FlakyEmbeddings(), staging_threshold=100)
+    store.add_texts(TEXTS[:5])
+    with pytest.raises(ValueError):
+        store.add_texts(["drop me", "and me"])
+
+    assert store.add_texts(TEXTS[5:10]) == [str(i) for i in range(5, 10)]
+    assert_top_hit(store, "document number 7")
+    store.flush()
+    assert_top_hit(store, "document number 7")
+
+
+def test_wrong_dimension_batch_is_not_staged():
+    store = PolarisDBVectorStore(FakeEmbeddings(), staging_threshold=100)
+    store.add_texts(TEXTS[:5])
+    store._embedding = FakeEmbeddings(dimension=4)
+    with pytest.raises(ValueError):
+        store.add_texts(["four dimensions"])
+
+    store._embedding = FakeEmbeddings()
+    assert store.add_texts(TEXTS[5:10]) == [str(i) for i in range(5, 10)]
+    assert_top_hit(store, "document number 7")
+    store.flush()
+    assert_top_hit(store, "document number 2")
+
+
+def test_concurrent_adds_and_searches():
+    store = PolarisDBVectorStore(FakeEmbeddings(), staging_threshold=7)
+
+    def work(offset):
+        ids = []
+        for text in TEXTS[offset::4]:
+            ids += store.add_texts([text])
+            store.similarity_search(text, k=2)
+        return ids
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        ids = [i for batch in pool.map(work, range(4)) for i in batch]
+    assert sorted(ids, key=int) == [str(i) for i in range(len(TEXTS))]
+    for text in TEXTS[::9]:
+        assert_top_hit(store, text)
+
+
+def test_aadd_texts_and_afrom_texts():
+    store = asyncio.run(
+        PolarisDBVectorStore.afrom_texts(
+            TEXTS, FakeEmbeddings(), ids=None, staging_threshold=0
+        )
+    )
+    assert store._staging_threshold == 0
+    asyncio.run(store.aadd_texts(["added asynchronously"], chunk_size=1))
+    assert_top_hit(store, "document number 12")
+    assert_top_hit(store, "added asynchronously")
+
+
+def test_afrom_documents_keeps_metadata():
+    documents = [
+        Document(page_content=text, metadata={"i": i}) for i, text in enumerate(TEXTS)
+    ]
+    store = asyncio.run(
+        PolarisDBVectorStore.afrom_documents(documents, FakeEmbeddings())
+    )
+    assert_top_hit(store, "document number 30", {"i": 30})
+
+
+def test_from_texts_forwards_constructor_kwargs_and_ignores_others():
+    store = PolarisDBVectorStore.from_texts(
+        TEXTS,
+        FakeEmbeddings(dimension=16),
+        ids=[str(i) for i in range(len(TEXTS))],
+        n_threads=2,
+        quantization="int8",
+    )
+    assert store._scales is not None and store._scales.shape == (16,)
+    assert_top_hit(store, "document number 20")
+
+
+def test_int8_store():
+    store = PolarisDBVectorStore(
+        FakeEmbeddings(dimension=32), quantization="int8", staging_threshold=0
+    )
+    store.add_texts(TEXTS)
+    assert store._scales.dtype == np.float32 and store._scales.shape == (32,)
+    assert_top_hit(store, "document number 5")
+
+
+@pytest.mark.parametrize("metric", ["cosine", "euclidean"])
+def test_blocked_quantize_matches_a_single_pass(metric):
+    store = PolarisDBVectorStore(FakeEmbeddings(), metric=metric, quantization="int8")
+    # Enough rows to span several quantization blocks at this dimension
+    vectors = np.random.default_rng(0).normal(size=(5000, 32)).astype(np.float32)
+    vectors[7] = 0.0
+    store._scales = store._fit_scales(vectors)
+
+    codes = store._quantize(vectors)
+    assert codes.dtype == np.int8 and codes.shape == vectors.shape
+    if metric == "cosine":
+        vectors = vectors / store._row_norms(vectors)
+    expected = np.clip(np.rint(vectors / store._scales), -127, 127)
+    assert np.abs(codes - expected).max() <= 1
+    assert not codes[7].any()
+
+
+def test_persistent_store_reopens_with_documents(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / "collection")
+    metadatas = [{"i": i, "pair": (i, 0)} for i in range(len(TEXTS))]
+
+    with PolarisDBVectorStore(FakeEmbeddings(), collection_path=path) as store:
+        store.add_texts(TEXTS, metadatas)
+        # Metadata reads back as JSON both before and after the flush
+        assert_top_hit(store, "document number 9", {"i": 9, "pair": [9, 0]})
+        with pytest.raises(TypeError):
+            store.add_texts(["dated"], [{"day": datetime.date(2024, 1, 1)}])
+
+    reopened = PolarisDBVectorStore(FakeEmbeddings(), collection_path=path)
+    assert_top_hit(reopened, "document number 9", {"i": 9, "pair": [9, 0]})
+    assert reopened.add_texts(["written after reopening"]) == [str(len(TEXTS))]
+    reopened.flush()
+
+    again = PolarisDBVectorStore(FakeEmbeddings(), collection_path=path, prewarm=True)
+    assert_top_hit(again, "written after reopening", {})
+    assert_top_hit(again, "document number 9")
+
+
+def test_dimension_is_resolved_without_an_embedding_probe(tmp_path):
+    embeddings = FakeEmbeddings()
+    store = PolarisDBVectorStore(embeddings)
+    assert store._dimension is None and embeddings.queried == 0
+    store.add_texts(TEXTS[:2])
+    assert store._dimension == embeddings.dimension
+
+    # A reopened collection takes its dimension from meta.json
+    path = str(tmp_path / "collection")
+    PolarisDBVectorStore.from_texts(TEXTS, FakeEmbeddings(), collection_path=path)
+    reopened_embeddings = FakeEmbeddings()
+    reopened = PolarisDBVectorStore(reopened_embeddings, collection_path=path)
+    assert reopened._dimension == reopened_embeddings.dimension
+    assert reopened_embeddings.queried == 0 and reopened_embeddings.embedded == 0
+
+
+def test_persistent_store_without_pyarrow_keeps_documents_in_memory(
+    tmp_path, monkeypatch
+):
+    def missing_pyarrow():
+        raise ImportError("pyarrow is required")
+
+    monkeypatch.setattr(langchain, "_import_pyarrow", missing_pyarrow)
+    path = str(tmp_path / "collection")
+    with pytest.warns(RuntimeWarning):
+        store = PolarisDBVectorStore(FakeEmbeddings(), collection_path=path)
+    store.add_texts(TEXTS, [{"i": i} for i in range(len(TEXTS))])
+    store.flush()
+    assert_top_hit(store, "document number 3", {"i": 3})
+
+
+def test_persistent_store_skips_ids_without_documents(tmp_path):
+    pytest.importorskip("pyarrow")
+    from polarisdb import Collection
+
+    path = str(tmp_path / "collection")
+    embeddings = FakeEmbeddings()
+    collection = Collection.open_or_create(path, embeddings.dimension, "cosine")
+    collection.insert(0, embeddings.embed_query("written by the raw API"))
+    collection.flush()
+    del collection
+
+    store = PolarisDBVectorStore(embeddings, collection_path=path)
+    assert store.similarity_search("written by the raw API") == []
+
+
+def test_embedding_cache_hits_and_misses(tmp_path):
+    cache_path = str(tmp_path / "embeddings.sqlite")
+    first = FakeEmbeddings()
+    PolarisDBVectorStore.from_texts(TEXTS, first, embedding_cache_path=cache_path)
+    assert first.embedded == len(TEXTS)
+
+    second = FakeEmbeddings()
+    store = PolarisDBVectorStore.from_texts(
+        TEXTS + ["not cached yet"], second, embedding_cache_path=cache_path
+    )
+    assert second.embedded == 1
+    assert_top_hit(store, "document number 4")
+    assert_top_hit(store, "not cached yet")
+
+    asyncio.run(store.aadd_texts(["not cached yet", "async miss"]))
+    assert second.embedded == 2
+
+
+def test_embedding_cache_ignores_vectors_of_another_dimension(tmp_path):
+    cache_path = str(tmp_path / "embeddings.sqlite")
+    PolarisDBVectorStore.from_texts(
+        TEXTS[:4], FakeEmbeddings(dimension=4), embedding_cache_path=cache_path
+    )
+
+    # Same fingerprint, different output size: stale hits are re-embedded
+    wider = FakeEmbeddings(dimension=6)
+    store = PolarisDBVectorStore.from_texts(
+        TEXTS[:8], wider, embedding_cache_path=cache_path
+    )
+    assert wider.embedded == 8
+    assert_top_hit(store, "document number 2")